@@ -115,7 +115,7 @@ class BookWriter:
         )
         
         logger.info(f"✅ Proyecto '{self.project_name}' inicializado con perfil '{style_profile}'")
-        logger.info(self.style_manager.get_summary())
+        logger.info("%s", self.style_manager.get_summary())
     
     # ========================================================================
     # INICIALIZACIÓN Y PERSISTENCIA
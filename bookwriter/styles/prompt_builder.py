@@ -4,9 +4,21 @@ Genera instrucciones específicas para el modelo según el perfil activo.
 """
 
 from typing import Dict, List, Any
-from .style_profiles import WRITING_DIMENSIONS, get_dimension_info
+from .style_profiles import get_dimension_info
 
 
+# Respuesta de la memoria semántica cuando no hay contexto que aportar
+_NO_CONTEXT_SENTINEL = "No hay contexto disponible en la memoria a largo plazo."
+
+# Nivel asumido para cada dimensión cuando la configuración no la define
+_DEFAULT_LEVELS = {
+    'prose_complexity': 'moderate',
+    'narrative_density': 'balanced',
+    'description_level': 'selective',
+    'thematic_depth': 'layered',
+    'dialogue_style': 'natural'
+}
+
 class PromptBuilder:
     """
     Construye prompts dinámicos para la generación de contenido
@@ -25,6 +37,17 @@ class PromptBuilder:
         self.special_instructions = style_config.get('special_instructions', [])
         self.avoid_list = style_config.get('avoid', [])
         self.examples = style_config.get('examples', [])
+        
+        # Resolver una sola vez la información de cada dimensión configurada
+        self.levels = {**_DEFAULT_LEVELS, **self.dimensions}
+        self.dimension_info = {
+            dimension: get_dimension_info(dimension, level)
+            for dimension, level in self.levels.items()
+        }
+        
+        # Las secciones de estilo del prompt del sistema solo dependen de la
+        # configuración, así que se construyen una vez
+        self.style_fragment = self._build_style_fragment()
     
     # ========================================================================
     # PROMPT DEL SISTEMA (Base)
@@ -54,18 +77,8 @@ class PromptBuilder:
 
 """
         
-        # Agregar perfil de estilo
-        prompt += self._build_style_section()
-        
-        # Agregar instrucciones especiales
-        if self.special_instructions:
-            prompt += self._build_special_instructions_section()
-        
-        # Agregar qué evitar
-        if self.avoid_list:
-            prompt += self._build_avoid_section()
-        
-        return prompt
+        # Agregar perfil de estilo, instrucciones especiales y qué evitar
+        return prompt + self.style_fragment
     
     # ========================================================================
     # PROMPT PARA GENERACIÓN DE OUTLINE
@@ -90,11 +103,11 @@ class PromptBuilder:
         """
         
         # Obtener características del estilo narrativo
-        narrative_density = self.dimensions.get('narrative_density', 'balanced')
-        thematic_depth = self.dimensions.get('thematic_depth', 'layered')
+        narrative_density = self.levels['narrative_density']
+        thematic_depth = self.levels['thematic_depth']
         
-        narrative_info = get_dimension_info('narrative_density', narrative_density)
-        thematic_info = get_dimension_info('thematic_depth', thematic_depth)
+        narrative_info = self.dimension_info['narrative_density']
+        thematic_info = self.dimension_info['thematic_depth']
         
         prompt = f"""Basado en la siguiente premisa, temas y estilo, genera un outline detallado para una novela de {num_chapters} capítulos.
 
@@ -194,7 +207,28 @@ class PromptBuilder:
             Prompt completo para generación de página
         """
         
-        prompt = f"""Estás escribiendo la página {page_number} de {total_pages} del siguiente capítulo:
+        # Bloques condicionales
+        if relevant_context and relevant_context != _NO_CONTEXT_SENTINEL:
+            context_block = f"""**CONTEXTO RELEVANTE DE CAPÍTULOS ANTERIORES:**
+{relevant_context}
+
+"""
+        else:
+            context_block = ""
+        
+        if last_written_text:
+            last_block = f"""**ÚLTIMO FRAGMENTO ESCRITO (Continúa DIRECTAMENTE desde aquí):**
+...{last_written_text}
+
+"""
+        else:
+            last_block = "**[INICIO DEL CAPÍTULO]**\n\n"
+        
+        # Instrucciones de estilo específicas y longitud objetivo
+        writing_instructions = self._build_page_writing_instructions(page_number, total_pages)
+        length_instruction = self._build_length_instruction(page_number, total_pages)
+        
+        return f"""Estás escribiendo la página {page_number} de {total_pages} del siguiente capítulo:
 
 **CAPÍTULO {chapter_info.get('number', 'N/A')}: "{chapter_info.get('title', 'Sin Título')}"**
 
@@ -207,56 +241,43 @@ class PromptBuilder:
 **PERSONAJES EN ESCENA:**
 {character_profiles if character_profiles else "No hay personajes específicos en foco"}
 
-"""
-        
-        # Agregar contexto previo si existe
-        if relevant_context and relevant_context != "No hay contexto disponible en la memoria a largo plazo.":
-            prompt += f"""**CONTEXTO RELEVANTE DE CAPÍTULOS ANTERIORES:**
-{relevant_context}
-
-"""
-        
-        # Agregar último texto escrito
-        if last_written_text:
-            prompt += f"""**ÚLTIMO FRAGMENTO ESCRITO (Continúa DIRECTAMENTE desde aquí):**
-...{last_written_text}
-
-"""
-        else:
-            prompt += "**[INICIO DEL CAPÍTULO]**\n\n"
-        
-        # Agregar instrucciones de estilo específicas
-        prompt += self._build_page_writing_instructions(page_number, total_pages)
-        
-        # Longitud objetivo
-        prompt += self._build_length_instruction(page_number, total_pages)
-        
-        return prompt
+{context_block}{last_block}{writing_instructions}{length_instruction}"""
     
     # ========================================================================
     # SECCIONES DEL PROMPT
     # ========================================================================
     
+    def _build_style_fragment(self) -> str:
+        """Construye el bloque de estilo, instrucciones especiales y elementos a evitar."""
+        
+        fragment = self._build_style_section()
+        
+        if self.special_instructions:
+            fragment += self._build_special_instructions_section()
+        
+        if self.avoid_list:
+            fragment += self._build_avoid_section()
+        
+        return fragment
+    
     def _build_style_section(self) -> str:
         """Construye la sección de descripción del estilo."""
         
         section = "**PERFIL DE ESTILO CONFIGURADO:**\n\n"
         
         # Recorrer cada dimensión configurada
-        for dimension_key, level in self.dimensions.items():
-            if dimension_key in WRITING_DIMENSIONS:
-                dimension_data = WRITING_DIMENSIONS[dimension_key]
-                if level in dimension_data:
-                    level_data = dimension_data[level]
-                    section += f"- **{dimension_key.replace('_', ' ').title()}:** {level_data['name']}\n"
-                    section += f"  {level_data['description']}\n"
-                    
-                    # Agregar características clave
-                    if 'characteristics' in level_data:
-                        section += "  Características:\n"
-                        for char in level_data['characteristics'][:3]:  # Limitar a 3
-                            section += f"    • {char}\n"
-                    section += "\n"
+        for dimension_key in self.dimensions:
+            level_data = self.dimension_info[dimension_key]
+            if level_data:
+                section += f"- **{dimension_key.replace('_', ' ').title()}:** {level_data['name']}\n"
+                section += f"  {level_data['description']}\n"
+                
+                # Agregar características clave
+                if 'characteristics' in level_data:
+                    section += "  Características:\n"
+                    for char in level_data['characteristics'][:3]:  # Limitar a 3
+                        section += f"    • {char}\n"
+                section += "\n"
         
         return section
     
@@ -326,14 +347,10 @@ class PromptBuilder:
     def _build_page_writing_instructions(self, page_number: int, total_pages: int) -> str:
         """Construye instrucciones específicas para escribir una página."""
         
-        prose_complexity = self.dimensions.get('prose_complexity', 'moderate')
-        description_level = self.dimensions.get('description_level', 'selective')
-        dialogue_style = self.dimensions.get('dialogue_style', 'natural')
-        
         instructions = "**INSTRUCCIONES DE ESCRITURA:**\n\n"
         
         # Instrucciones según complejidad de prosa
-        prose_info = get_dimension_info('prose_complexity', prose_complexity)
+        prose_info = self.dimension_info['prose_complexity']
         if prose_info:
             instructions += f"**Estilo de Prosa:** {prose_info.get('name')}\n"
             for char in prose_info.get('characteristics', [])[:3]:
@@ -341,7 +358,7 @@ class PromptBuilder:
             instructions += "\n"
         
         # Instrucciones según nivel de descripción
-        desc_info = get_dimension_info('description_level', description_level)
+        desc_info = self.dimension_info['description_level']
         if desc_info:
             instructions += f"**Nivel de Descripción:** {desc_info.get('name')}\n"
             for char in desc_info.get('characteristics', [])[:3]:
@@ -349,7 +366,7 @@ class PromptBuilder:
             instructions += "\n"
         
         # Instrucciones según estilo de diálogo
-        dialogue_info = get_dimension_info('dialogue_style', dialogue_style)
+        dialogue_info = self.dimension_info['dialogue_style']
         if dialogue_info:
             instructions += f"**Estilo de Diálogo:** {dialogue_info.get('name')}\n"
             for char in dialogue_info.get('characteristics', [])[:2]:
@@ -376,7 +393,7 @@ class PromptBuilder:
         """Determina la longitud objetivo según el estilo."""
         
         # Ajustar longitud según densidad narrativa
-        narrative_density = self.dimensions.get('narrative_density', 'balanced')
+        narrative_density = self.levels['narrative_density']
         
         if narrative_density == "fast_paced":
             min_words, max_words = 350, 450
@@ -3,15 +3,28 @@ Gestor de estilos de escritura. Coordina la configuración del perfil
 y proporciona acceso a las instrucciones adaptadas.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 from .style_profiles import (
     STYLE_PRESETS, 
     DEFAULT_PROFILE, 
     WRITING_DIMENSIONS,
+    VALID_DIMENSION_LEVELS,
     get_profile_info,
     get_dimension_info
 )
 import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _thaw(value: Any) -> Any:
+    """Convierte vistas de solo lectura y tuplas en dicts y listas mutables."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
 
 
 class StyleManager:
@@ -54,12 +67,12 @@ class StyleManager:
             profile_name: Nombre del perfil
             
         Returns:
-            Configuración del perfil (copia profunda)
+            Configuración del perfil (copia mutable)
         """
         profile_info = get_profile_info(profile_name)
         
-        # Hacer una copia profunda para no modificar el original
-        return copy.deepcopy(profile_info)
+        # El perfil original es de solo lectura: se copia a dicts y listas propios
+        return _thaw(profile_info)
     
     def _apply_custom_dimensions(self, custom_dimensions: Dict[str, str]):
         """
@@ -69,17 +82,17 @@ class StyleManager:
             custom_dimensions: Dict con dimensiones a sobrescribir
         """
         current_dimensions = self.profile_config.get('dimensions', {})
+        invalid = []
         
         for dimension, level in custom_dimensions.items():
-            # Validar que la dimensión exista
-            if dimension in WRITING_DIMENSIONS:
-                # Validar que el nivel exista en esa dimensión
-                if level in WRITING_DIMENSIONS[dimension]:
-                    current_dimensions[dimension] = level
-                else:
-                    print(f"⚠️ Advertencia: Nivel '{level}' no válido para dimensión '{dimension}'")
+            # Validar el par (dimensión, nivel) en una sola consulta
+            if (dimension, level) in VALID_DIMENSION_LEVELS:
+                current_dimensions[dimension] = level
             else:
-                print(f"⚠️ Advertencia: Dimensión '{dimension}' no reconocida")
+                invalid.append((dimension, level))
+        
+        if invalid:
+            logger.warning("⚠️ Dimensiones personalizadas ignoradas (no válidas): %s", invalid)
         
         self.profile_config['dimensions'] = current_dimensions
     
@@ -119,7 +132,7 @@ class StyleManager:
         """
         return self.profile_config.get('dimensions', {}).get(dimension_name, 'moderate')
     
-    def get_dimension_details(self, dimension_name: str) -> Dict[str, Any]:
+    def get_dimension_details(self, dimension_name: str) -> Mapping[str, Any]:
         """
         Obtiene información detallada de la dimensión configurada.
         
@@ -154,42 +167,17 @@ class StyleManager:
     # INFORMACIÓN Y DIAGNÓSTICO
     # ========================================================================
     
-    def get_summary(self) -> str:
+    def get_summary(self) -> '_LazySummary':
         """
         Genera un resumen legible del perfil configurado.
         
+        El resumen se construye al convertirlo a string, de modo que
+        los logs con un nivel desactivado no pagan el costo de formatearlo.
+        
         Returns:
-            String con resumen formateado
+            Objeto cuyo str() es el resumen formateado
         """
-        config = self.profile_config
-        
-        summary = f"""
-╔══════════════════════════════════════════════════════════════╗
-║  PERFIL DE ESTILO: {config.get('name', 'Sin nombre')[:43].ljust(43)} ║
-╚══════════════════════════════════════════════════════════════╝
-
-📝 Descripción:
-   {config.get('description', 'Sin descripción')}
-
-📊 Dimensiones Configuradas:
-"""
-        
-        dimensions = config.get('dimensions', {})
-        for dim_key, level in dimensions.items():
-            dim_info = get_dimension_info(dim_key, level)
-            dim_name = dim_key.replace('_', ' ').title()
-            level_name = dim_info.get('name', level) if dim_info else level
-            summary += f"   • {dim_name}: {level_name}\n"
-        
-        special = self.get_special_instructions()
-        if special:
-            summary += f"\n✨ Instrucciones Especiales: {len(special)} configuradas\n"
-        
-        avoid = self.get_avoid_list()
-        if avoid:
-            summary += f"⚠️  Elementos a Evitar: {len(avoid)} configurados\n"
-        
-        return summary
+        return _LazySummary(self)
     
     def is_complex_narrative(self) -> bool:
         """
@@ -235,10 +223,11 @@ class StyleManager:
             dimension_name: Nombre de la dimensión a actualizar
             new_level: Nuevo nivel para la dimensión
         """
-        if dimension_name not in WRITING_DIMENSIONS:
+        levels = WRITING_DIMENSIONS.get(dimension_name)
+        if levels is None:
             raise ValueError(f"Dimensión '{dimension_name}' no reconocida")
         
-        if new_level not in WRITING_DIMENSIONS[dimension_name]:
+        if new_level not in levels:
             raise ValueError(f"Nivel '{new_level}' no válido para dimensión '{dimension_name}'")
         
         self.profile_config['dimensions'][dimension_name] = new_level
@@ -297,4 +286,51 @@ class StyleManager:
         """
         manager = cls(profile_name=data.get('profile_name', DEFAULT_PROFILE))
         manager.profile_config = copy.deepcopy(data.get('config', {}))
-        return manager
\ No newline at end of file
+        return manager
+
+
+# ============================================================================
+# RESUMEN DIFERIDO
+# ============================================================================
+
+class _LazySummary:
+    """Difiere la construcción del resumen de un StyleManager hasta que se muestra."""
+    
+    def __init__(self, manager: StyleManager):
+        self.manager = manager
+    
+    def __str__(self) -> str:
+        return _render_summary(self.manager)
+
+
+def _render_summary(manager: StyleManager) -> str:
+    """Construye el resumen formateado del perfil de un StyleManager."""
+    config = manager.profile_config
+    
+    summary = f"""
+╔══════════════════════════════════════════════════════════════╗
+║  PERFIL DE ESTILO: {config.get('name', 'Sin nombre')[:43].ljust(43)} ║
+╚══════════════════════════════════════════════════════════════╝
+
+📝 Descripción:
+   {config.get('description', 'Sin descripción')}
+
+📊 Dimensiones Configuradas:
+"""
+    
+    dimensions = config.get('dimensions', {})
+    for dim_key, level in dimensions.items():
+        dim_info = get_dimension_info(dim_key, level)
+        dim_name = dim_key.replace('_', ' ').title()
+        level_name = dim_info.get('name', level) if dim_info else level
+        summary += f"   • {dim_name}: {level_name}\n"
+    
+    special = manager.get_special_instructions()
+    if special:
+        summary += f"\n✨ Instrucciones Especiales: {len(special)} configuradas\n"
+    
+    avoid = manager.get_avoid_list()
+    if avoid:
+        summary += f"⚠️  Elementos a Evitar: {len(avoid)} configurados\n"
+    
+    return summary
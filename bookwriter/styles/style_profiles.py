@@ -2,7 +2,10 @@
 Perfiles y dimensiones de estilo predefinidos para diferentes tipos de narrativa.
 """
 
-from typing import Dict, List, Any
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, FrozenSet, Mapping, Tuple
 
 # ============================================================================
 # DIMENSIONES DE ESCRITURA
@@ -13,42 +16,42 @@ WRITING_DIMENSIONS = {
         "simple": {
             "name": "Simple y Directa",
             "description": "Oraciones cortas, vocabulario accesible, sin florituras",
-            "characteristics": [
+            "characteristics": (
                 "Oraciones de 10-15 palabras en promedio",
                 "Vocabulario cotidiano",
                 "Estructura sujeto-verbo-objeto",
                 "Evita metáforas complejas"
-            ]
+            )
         },
         "moderate": {
             "name": "Balanceada",
             "description": "Mezcla de claridad y elaboración literaria",
-            "characteristics": [
+            "characteristics": (
                 "Oraciones variadas en longitud",
                 "Vocabulario enriquecido pero comprensible",
                 "Algunas metáforas y figuras retóricas",
                 "Balance entre mostrar y contar"
-            ]
+            )
         },
         "complex": {
             "name": "Compleja y Literaria",
             "description": "Prosa elaborada con profundidad estilística",
-            "characteristics": [
+            "characteristics": (
                 "Oraciones largas y subordinadas",
                 "Vocabulario sofisticado",
                 "Metáforas elaboradas y simbolismo",
                 "Múltiples capas de significado"
-            ]
+            )
         },
         "experimental": {
             "name": "Experimental",
             "description": "Experimentación lingüística y narrativa",
-            "characteristics": [
+            "characteristics": (
                 "Estructura narrativa no lineal",
                 "Juegos de lenguaje y neologismos",
                 "Ruptura de convenciones",
                 "Prosa poética o fragmentada"
-            ]
+            )
         }
     },
     
@@ -56,42 +59,42 @@ WRITING_DIMENSIONS = {
         "fast_paced": {
             "name": "Ritmo Rápido",
             "description": "Acción constante, cambios frecuentes de escena",
-            "characteristics": [
+            "characteristics": (
                 "Escenas cortas y dinámicas",
                 "Transiciones rápidas",
                 "Mínimo tiempo muerto",
                 "Enfoque en eventos externos"
-            ]
+            )
         },
         "balanced": {
             "name": "Equilibrado",
             "description": "Alterna entre acción y reflexión",
-            "characteristics": [
+            "characteristics": (
                 "Mezcla de escenas de acción e introspección",
                 "Ritmo variable según necesidades de la trama",
                 "Balance entre externo e interno",
                 "Pausas estratégicas"
-            ]
+            )
         },
         "contemplative": {
             "name": "Contemplativo",
             "description": "Énfasis en reflexión y atmósfera",
-            "characteristics": [
+            "characteristics": (
                 "Escenas largas y detalladas",
                 "Énfasis en estados internos",
                 "Desarrollo atmosférico",
                 "Tiempo para la introspección"
-            ]
+            )
         },
         "epic": {
             "name": "Épico",
             "description": "Narrativa expansiva con múltiples líneas argumentales",
-            "characteristics": [
+            "characteristics": (
                 "Múltiples puntos de vista",
                 "Tramas paralelas complejas",
                 "Worldbuilding extenso",
                 "Escala temporal amplia"
-            ]
+            )
         }
     },
     
@@ -99,42 +102,42 @@ WRITING_DIMENSIONS = {
         "minimal": {
             "name": "Minimalista",
             "description": "Solo detalles esenciales para la trama",
-            "characteristics": [
+            "characteristics": (
                 "Descripciones funcionales únicamente",
                 "Máximo 2-3 líneas por escenario",
                 "Sin detalles sensoriales elaborados",
                 "Prioridad absoluta a la acción"
-            ]
+            )
         },
         "selective": {
             "name": "Selectiva",
             "description": "Descripciones estratégicas en momentos clave",
-            "characteristics": [
+            "characteristics": (
                 "Descripciones cuando aportan a la atmósfera",
                 "Detalles significativos para la trama",
                 "Balance entre mostrar y avanzar",
                 "Énfasis en lo visualmente impactante"
-            ]
+            )
         },
         "rich": {
             "name": "Rica",
             "description": "Descripciones detalladas y evocadoras",
-            "characteristics": [
+            "characteristics": (
                 "Detalles sensoriales completos",
                 "Descripciones de 1-2 párrafos",
                 "Énfasis en atmósfera y mood",
                 "Worldbuilding integrado"
-            ]
+            )
         },
         "immersive": {
             "name": "Inmersiva",
             "description": "Experiencia sensorial completa",
-            "characteristics": [
+            "characteristics": (
                 "Todos los sentidos representados",
                 "Descripciones extensas y poéticas",
                 "Construcción de mundo detallada",
                 "El escenario como personaje"
-            ]
+            )
         }
     },
     
@@ -142,42 +145,42 @@ WRITING_DIMENSIONS = {
         "entertainment": {
             "name": "Entretenimiento",
             "description": "Enfoque principal en la trama y el disfrute",
-            "characteristics": [
+            "characteristics": (
                 "Los temas sirven a la historia",
                 "Mensajes claros y directos",
                 "Sin ambigüedad moral compleja",
                 "Resoluciones satisfactorias"
-            ]
+            )
         },
         "layered": {
             "name": "Por Capas",
             "description": "Temas sutiles entretejidos en la narrativa",
-            "characteristics": [
+            "characteristics": (
                 "Subtexto presente pero no dominante",
                 "Temas se revelan gradualmente",
                 "Simbolismo moderado",
                 "Interpretaciones múltiples posibles"
-            ]
+            )
         },
         "philosophical": {
             "name": "Filosófico",
             "description": "Exploración profunda de ideas y conceptos",
-            "characteristics": [
+            "characteristics": (
                 "Temas filosóficos centrales",
                 "Dilemas morales complejos",
                 "Cuestionamiento existencial",
                 "Sin respuestas fáciles"
-            ]
+            )
         },
         "deconstructive": {
             "name": "Deconstructivo",
             "description": "Deconstrucción de géneros y expectativas",
-            "characteristics": [
+            "characteristics": (
                 "Subversión de tropos",
                 "Meta-narrativa",
                 "Ambigüedad intencional",
                 "Desafío al lector"
-            ]
+            )
         }
     },
     
@@ -185,50 +188,59 @@ WRITING_DIMENSIONS = {
         "functional": {
             "name": "Funcional",
             "description": "Diálogos directos que avanzan la trama",
-            "characteristics": [
+            "characteristics": (
                 "Intercambios breves",
                 "Información clara y directa",
                 "Sin subtexto complejo",
                 "Enfoque en avanzar la historia"
-            ]
+            )
         },
         "natural": {
             "name": "Natural",
             "description": "Diálogos realistas con subtexto",
-            "characteristics": [
+            "characteristics": (
                 "Conversaciones orgánicas",
                 "Incluye pausas y evasivas",
                 "Subtexto moderado",
                 "Revela personalidad"
-            ]
+            )
         },
         "stylized": {
             "name": "Estilizado",
             "description": "Diálogos con personalidad literaria fuerte",
-            "characteristics": [
+            "characteristics": (
                 "Voces muy distintivas",
                 "Puede ser más elaborado que el habla real",
                 "Sirve al tono de la obra",
                 "Memorablemente único"
-            ]
+            )
         },
         "poetic": {
             "name": "Poético",
             "description": "Diálogos como arte verbal",
-            "characteristics": [
+            "characteristics": (
                 "Alta elaboración lingüística",
                 "Metáforas en el habla",
                 "Ritmo y musicalidad",
                 "Puede sacrificar realismo por belleza"
-            ]
+            )
         }
     }
 }
 
+# Pares (dimensión, nivel) válidos, para validar configuraciones en una sola consulta
+VALID_DIMENSION_LEVELS: FrozenSet[Tuple[str, str]] = frozenset(
+    (dimension, level)
+    for dimension, levels in WRITING_DIMENSIONS.items()
+    for level in levels
+)
+
 # ============================================================================
 # PERFILES PREDEFINIDOS
 # ============================================================================
 
+DEFAULT_PROFILE = "balanced_neutral"
+
 STYLE_PRESETS = {
     # ------------------------------------------------------------------------
     # PERFIL: EVANGELION - Ciencia ficción psicológica compleja
@@ -243,13 +255,13 @@ STYLE_PRESETS = {
             "thematic_depth": "philosophical",
             "dialogue_style": "natural"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Simbolismo presente pero no dominante",
             "Monólogos internos breves y poderosos",
             "Balance entre introspección y acción",
             "Claridad sin sacrificar profundidad",
             "Primeros párrafos siempre concretos"
-        ]
+        )
     },
     "evangelion": {
         "name": "Evangelion - Psicológico Complejo",
@@ -261,7 +273,7 @@ STYLE_PRESETS = {
         "thematic_depth": "philosophical",
         "dialogue_style": "stylized"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Permite y fomenta el simbolismo religioso y filosófico",
             "Los monólogos internos pueden ser extensos y fragmentados",
             "La ambigüedad narrativa es una característica, no un error",
@@ -269,16 +281,16 @@ STYLE_PRESETS = {
             "Las escenas pueden tener múltiples capas de interpretación",
             "El silencio y las pausas son significativos",
             "No temas dejar preguntas sin responder inmediata"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Resoluciones simplistas de conflictos psicológicos",
             "Explicaciones directas de simbolismo",
             "Ritmo uniformemente rápido"
-        ],
-        "examples": [
+        ),
+        "examples": (
             "Correcto: 'El mar rojo se extendía ante él, infinito como su culpa. O quizás era el cielo. Ya no podía distinguir dónde terminaba uno y empezaba el otro.'",
             "Incorrecto: 'Miró el mar rojo y se sintió culpable por lo que había hecho.'"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -294,23 +306,23 @@ STYLE_PRESETS = {
             "thematic_depth": "entertainment",
             "dialogue_style": "functional"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Cada escena debe avanzar la trama",
             "Oraciones cortas en momentos de acción",
             "Descripciones solo de elementos relevantes para la acción",
             "Capítulos cortos con cliffhangers",
             "Ritmo constante y creciente",
             "Diálogos concisos y con propósito"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Descripciones atmosféricas largas",
             "Introspección extensa",
             "Escenas sin conflicto directo"
-        ],
-        "examples": [
+        ),
+        "examples": (
             "Correcto: 'Corrió. La puerta estaba a veinte metros. Quince. Los pasos se acercaban detrás.'",
             "Incorrecto: 'Corrió por el pasillo, cuyas paredes de un blanco impoluto reflejaban la luz fluorescente que parpadeaba suavemente...'"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -326,23 +338,23 @@ STYLE_PRESETS = {
             "thematic_depth": "layered",
             "dialogue_style": "stylized"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Dedica espacio al worldbuilding y la historia del mundo",
             "Múltiples puntos de vista son bienvenidos",
             "Las descripciones de lugares son importantes",
             "Los sistemas de magia/poder deben ser consistentes",
             "Permite tramas paralelas complejas",
             "El tono puede ser elevado y formal cuando sea apropiado"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Ritmo uniformemente rápido sin pausas",
             "Worldbuilding superficial",
             "Resoluciones fáciles de conflictos mayores"
-        ],
-        "examples": [
+        ),
+        "examples": (
             "Correcto: 'Las Torres de Cristal se alzaban sobre el Valle de Ámbar, testigos mudos de mil años de magia olvidada.'",
             "Incorrecto: 'Había unas torres de cristal en el valle.'"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -358,18 +370,18 @@ STYLE_PRESETS = {
             "thematic_depth": "layered",
             "dialogue_style": "natural"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Los diálogos entre protagonistas son el corazón de la historia",
             "Permite momentos íntimos y de desarrollo emocional",
             "Las descripciones deben capturar mood y atmósfera romántica",
             "La tensión emocional es tan importante como la física",
             "Los conflictos internos son válidos y necesarios"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Resolución instantánea de conflictos emocionales",
             "Diálogos puramente funcionales en escenas románticas",
             "Falta de subtexto emocional"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -385,19 +397,19 @@ STYLE_PRESETS = {
             "thematic_depth": "philosophical",
             "dialogue_style": "natural"
         },
-        "special_instructions": [
+        "special_instructions": (
             "La atmósfera es fundamental - dedica espacio a construirla",
             "Lo no dicho es tan importante como lo dicho",
             "Descripciones sensoriales detalladas (sonidos, olores, texturas)",
             "El horror puede ser sugerido en lugar de explícito",
             "Permite que la tensión se construya lentamente",
             "Los espacios y el ambiente son casi personajes"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Horror explícito constante",
             "Explicaciones racionales inmediatas",
             "Ritmo demasiado rápido que no permite tensión"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -413,19 +425,19 @@ STYLE_PRESETS = {
             "thematic_depth": "deconstructive",
             "dialogue_style": "poetic"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Se alienta la experimentación con estructura narrativa",
             "La prosa puede ser poética y no convencional",
             "Permite flujo de consciencia y narrativa fragmentada",
             "Los temas pueden ser abstractos y filosóficos",
             "No todas las preguntas necesitan respuesta",
             "El estilo es tan importante como la historia"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Convenciones narrativas rígidas",
             "Resoluciones tradicionales",
             "Claridad por sobre expresión artística"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -441,18 +453,18 @@ STYLE_PRESETS = {
             "thematic_depth": "entertainment",
             "dialogue_style": "natural"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Las pistas deben estar presentes pero no ser obvias",
             "Cada capítulo debe revelar o complicar el misterio",
             "Los diálogos de interrogatorio son momentos clave",
             "La lógica deductiva debe ser sólida",
             "Permite red herrings y giros sorpresivos"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Pistas que aparecen solo al final",
             "Resoluciones basadas en información no presentada",
             "Detectivismo sin proceso lógico"
-        ]
+        )
     },
     
     # ------------------------------------------------------------------------
@@ -468,45 +480,83 @@ STYLE_PRESETS = {
             "thematic_depth": "philosophical",
             "dialogue_style": "natural"
         },
-        "special_instructions": [
+        "special_instructions": (
             "Los conceptos científicos deben ser coherentes y bien desarrollados",
             "Permite explicaciones técnicas cuando sean relevantes",
             "La especulación debe estar fundamentada",
             "Los problemas se resuelven con lógica y ciencia",
             "El worldbuilding sigue reglas científicas establecidas"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Tecnología mágica sin explicación",
             "Violaciones de las propias reglas científicas establecidas",
             "Simplicidad excesiva en conceptos complejos"
-        ]
+        )
+    },
+    
+    # ------------------------------------------------------------------------
+    # PERFIL: BALANCEADO Y NEUTRAL (por defecto)
+    # ------------------------------------------------------------------------
+    "balanced_neutral": {
+        "name": "Balanceado y Neutral",
+        "description": "Estilo versátil que se adapta a la historia sin imponer características extremas",
+        "dimensions": {
+            "prose_complexity": "moderate",
+            "narrative_density": "balanced",
+            "description_level": "selective",
+            "thematic_depth": "layered",
+            "dialogue_style": "natural"
+        },
+        "special_instructions": (
+            "Adapta el estilo según las necesidades de cada escena",
+            "Balance entre mostrar y contar",
+            "Claridad sin sacrificar profundidad",
+            "Ritmo variable según el contexto"
+        ),
+        "avoid": ()
     }
 }
 
-# ============================================================================
-# PERFIL POR DEFECTO
-# ============================================================================
+# Internar nombres de perfiles, dimensiones y niveles para que las comparaciones
+# de claves se resuelvan por identidad
+WRITING_DIMENSIONS = {
+    sys.intern(dimension): {sys.intern(level): info for level, info in levels.items()}
+    for dimension, levels in WRITING_DIMENSIONS.items()
+}
+for _preset in STYLE_PRESETS.values():
+    _preset["dimensions"] = {
+        sys.intern(dimension): sys.intern(level)
+        for dimension, level in _preset["dimensions"].items()
+    }
+STYLE_PRESETS = {sys.intern(name): preset for name, preset in STYLE_PRESETS.items()}
+del _preset
 
-DEFAULT_PROFILE = "balanced_neutral"
+def _freeze_preset(preset: Dict[str, Any]) -> Mapping[str, Any]:
+    """Congela un perfil: sus sub-diccionarios pasan a ser vistas de solo lectura."""
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in preset.items()
+    })
 
-STYLE_PRESETS["balanced_neutral"] = {
-    "name": "Balanceado y Neutral",
-    "description": "Estilo versátil que se adapta a la historia sin imponer características extremas",
-    "dimensions": {
-        "prose_complexity": "moderate",
-        "narrative_density": "balanced",
-        "description_level": "selective",
-        "thematic_depth": "layered",
-        "dialogue_style": "natural"
-    },
-    "special_instructions": [
-        "Adapta el estilo según las necesidades de cada escena",
-        "Balance entre mostrar y contar",
-        "Claridad sin sacrificar profundidad",
-        "Ritmo variable según el contexto"
-    ],
-    "avoid": []
+# Los perfiles y dimensiones son de solo lectura una vez cargado el módulo
+# (en todos sus niveles: dimensión, nivel e información del nivel)
+WRITING_DIMENSIONS = MappingProxyType({
+    dimension: MappingProxyType({
+        level: MappingProxyType(info) for level, info in levels.items()
+    })
+    for dimension, levels in WRITING_DIMENSIONS.items()
+})
+
+# Índices precalculados para que cada consulta sea un único acceso por hash
+_PROFILE_INDEX = {name: _freeze_preset(preset) for name, preset in STYLE_PRESETS.items()}
+STYLE_PRESETS = MappingProxyType(_PROFILE_INDEX)
+_DIMENSION_INDEX = {
+    (dimension, level): info
+    for dimension, levels in WRITING_DIMENSIONS.items()
+    for level, info in levels.items()
 }
+_EMPTY = MappingProxyType({})
+_PROFILE_NAMES = tuple(STYLE_PRESETS.keys())
 
 # ============================================================================
 # FUNCIONES AUXILIARES
@@ -514,18 +564,14 @@ STYLE_PRESETS["balanced_neutral"] = {
 
 def get_profile_names() -> List[str]:
     """Retorna lista de nombres de perfiles disponibles."""
-    return list(STYLE_PRESETS.keys())
+    return list(_PROFILE_NAMES)
 
-def get_profile_info(profile_name: str) -> Dict[str, Any]:
-    """Retorna información completa de un perfil."""
-    if profile_name not in STYLE_PRESETS:
-        return STYLE_PRESETS[DEFAULT_PROFILE]
-    return STYLE_PRESETS[profile_name]
+@lru_cache(maxsize=128)
+def get_profile_info(profile_name: str) -> Mapping[str, Any]:
+    """Retorna información completa de un perfil (vista de solo lectura)."""
+    return _PROFILE_INDEX.get(profile_name) or _PROFILE_INDEX[DEFAULT_PROFILE]
 
-def get_dimension_info(dimension: str, level: str) -> Dict[str, Any]:
-    """Retorna información de una dimensión específica."""
-    if dimension not in WRITING_DIMENSIONS:
-        return {}
-    if level not in WRITING_DIMENSIONS[dimension]:
-        return {}
-    return WRITING_DIMENSIONS[dimension][level]
\ No newline at end of file
+@lru_cache(maxsize=128)
+def get_dimension_info(dimension: str, level: str) -> Mapping[str, Any]:
+    """Retorna información de una dimensión específica (vista de solo lectura)."""
+    return _DIMENSION_INDEX.get((dimension, level), _EMPTY)
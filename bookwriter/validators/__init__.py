@@ -3,12 +3,30 @@ Sistema de validación para BookWriter AI.
 Valida entradas de usuario, contenido generado y consistencia narrativa.
 """
 
-from .input_validator import InputValidator
-from .content_validator import ContentValidator
-from .consistency_validator import ConsistencyValidator
+import importlib
+
+# Cada validador se importa la primera vez que se accede a él (PEP 562)
+_LAZY = {
+    'InputValidator': '.input_validator',
+    'ContentValidator': '.content_validator',
+    'ConsistencyValidator': '.consistency_validator'
+}
 
 __all__ = [
     'InputValidator',
     'ContentValidator',
     'ConsistencyValidator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -3,10 +3,44 @@ Validador de consistencia narrativa.
 Verifica que la historia mantenga coherencia interna.
 """
 
+from collections import Counter
 from typing import Dict, Any, List, Tuple, Set
 import re
 
 
+# Patrones precompilados
+_TIME_RE = re.compile(
+    r'(?P<duration>\d+\s+(?:días?|semanas?|meses?|años?))'
+    r'|(?P<relative>ayer|hoy|mañana|anoche)'
+    r'|(?P<absolute>pasado|presente|futuro)'
+)
+_PROPER_NAME_RE = re.compile(r'\b[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+\b')
+
+# Encabezados del reporte de consistencia
+_REPORT_HEADER = "📊 REPORTE DE CONSISTENCIA\n" + "=" * 60 + "\n\n"
+_WORLD_HEADER = "🌍 WORLDBUILDING:\n"
+_CHARACTERS_HEADER = "👥 PERSONAJES ({count}):\n"
+_NARRATIVE_HEADER = "📖 PROGRESO NARRATIVO:\n"
+
+# Palabras capitalizadas frecuentes que no son nombres de personajes
+_COMMON_WORDS = frozenset({'El', 'La', 'Los', 'Las', 'Un', 'Una', 'Algunos', 'Muchos'})
+
+# Pares de grupos de palabras contradictorias
+_CONTRADICTION_PAIRS = (
+    (('muerto', 'murió', 'fallecido'), ('vivo', 'despierto', 'consciente')),
+    (('feliz', 'alegre', 'contento'), ('triste', 'deprimido', 'desesperado')),
+    (('confiado', 'seguro'), ('inseguro', 'temeroso')),
+    (('herido', 'lastimado'), ('sano', 'ileso', 'recuperado'))
+)
+
+# Cada palabra marca el bit (par * 2 + grupo) en la máscara de un estado
+_CONTRADICTION_BITS = tuple(
+    (word, 1 << (pair_index * 2 + group_index))
+    for pair_index, groups in enumerate(_CONTRADICTION_PAIRS)
+    for group_index, group in enumerate(groups)
+    for word in group
+)
+
 class ConsistencyValidator:
     """
     Valida la consistencia interna de la narrativa.
@@ -20,7 +54,8 @@ class ConsistencyValidator:
     @staticmethod
     def validate_character_consistency(character_name: str,
                                        original_data: Dict[str, Any],
-                                       state_history: List[str]) -> Tuple[bool, List[str]]:
+                                       state_history: List[str],
+                                       fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida que un personaje mantenga consistencia.
         
@@ -28,6 +63,7 @@ class ConsistencyValidator:
             character_name: Nombre del personaje
             original_data: Datos originales del personaje
             state_history: Historial de estados del personaje
+            fast_fail: Detenerse en el primer problema encontrado
             
         Returns:
             Tupla (consistente: bool, lista de problemas: List[str])
@@ -39,41 +75,50 @@ class ConsistencyValidator:
         if 'current_state' not in original_data:
             problems.append(f"{character_name}: Falta estado actual")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar cambios drásticos sin justificación
         if len(state_history) > 1:
-            for i in range(len(state_history) - 1):
-                prev_state = state_history[i].lower()
-                next_state = state_history[i + 1].lower()
+            # Una sola pasada por estado; cada par consecutivo compara máscaras
+            prev_mask = ConsistencyValidator._contradiction_mask(state_history[0].lower())
+            
+            for i in range(1, len(state_history)):
+                mask = ConsistencyValidator._contradiction_mask(state_history[i].lower())
                 
                 # Detectar cambios contradictorios
-                contradictions = ConsistencyValidator._detect_contradictions(prev_state, next_state)
+                contradictions = ConsistencyValidator._describe_contradiction(prev_mask, mask)
                 if contradictions:
-                    problems.append(f"{character_name}: Posible contradicción entre estados {i+1} y {i+2}: {contradictions}")
+                    problems.append(f"{character_name}: Posible contradicción entre estados {i} y {i+1}: {contradictions}")
+                    if fast_fail:
+                        break
+                
+                prev_mask = mask
         
         is_consistent = len(problems) == 0
         
         return is_consistent, problems
     
     @staticmethod
-    def _detect_contradictions(state1: str, state2: str) -> str:
-        """Detecta contradicciones entre dos estados."""
-        
-        # Pares contradictorios
-        contradictions = [
-            (['muerto', 'murió', 'fallecido'], ['vivo', 'despierto', 'consciente']),
-            (['feliz', 'alegre', 'contento'], ['triste', 'deprimido', 'desesperado']),
-            (['confiado', 'seguro'], ['inseguro', 'temeroso']),
-            (['herido', 'lastimado'], ['sano', 'ileso', 'recuperado'])
-        ]
-        
-        for group1, group2 in contradictions:
-            has_state1_g1 = any(word in state1 for word in group1)
-            has_state1_g2 = any(word in state1 for word in group2)
-            has_state2_g1 = any(word in state2 for word in group1)
-            has_state2_g2 = any(word in state2 for word in group2)
+    def _contradiction_mask(state: str) -> int:
+        """Calcula qué grupos de palabras contradictorias aparecen en un estado."""
+        
+        mask = 0
+        for word, bit in _CONTRADICTION_BITS:
+            if not mask & bit and word in state:
+                mask |= bit
+        return mask
+    
+    @staticmethod
+    def _describe_contradiction(mask1: int, mask2: int) -> str:
+        """Describe el primer par contradictorio entre las máscaras de dos estados."""
+        
+        for pair_index, (group1, group2) in enumerate(_CONTRADICTION_PAIRS):
+            bit1 = 1 << (pair_index * 2)
+            bit2 = bit1 << 1
             
             # Si estado 1 tiene grupo1 y estado 2 tiene grupo2, o viceversa
-            if (has_state1_g1 and has_state2_g2) or (has_state1_g2 and has_state2_g1):
+            if (mask1 & bit1 and mask2 & bit2) or (mask1 & bit2 and mask2 & bit1):
                 return f"Cambio de {group1[0]} a {group2[0]} sin transición"
         
         return ""
@@ -84,13 +129,15 @@ class ConsistencyValidator:
     
     @staticmethod
     def validate_world_consistency(world_data: Dict[str, Any],
-                                   consistency_rules: List[str]) -> Tuple[bool, List[str]]:
+                                   consistency_rules: List[str],
+                                   fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida que el worldbuilding mantenga consistencia.
         
         Args:
             world_data: Datos del mundo
             consistency_rules: Reglas de consistencia establecidas
+            fast_fail: Detenerse en el primer problema encontrado
             
         Returns:
             Tupla (consistente: bool, lista de problemas: List[str])
@@ -103,15 +150,18 @@ class ConsistencyValidator:
             problems.append("World: Falta definición de ubicaciones clave")
         else:
             locations = world_data['key_locations']
-            if not isinstance(locations, dict) or len(locations) == 0:
+            if type(locations) is not dict or len(locations) == 0:
                 problems.append("World: No hay ubicaciones definidas")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar reglas del mundo
         if 'rules_of_the_world' not in world_data:
             problems.append("World: Falta definición de reglas del mundo")
         else:
             rules = world_data['rules_of_the_world']
-            if not isinstance(rules, list) or len(rules) == 0:
+            if type(rules) is not list or len(rules) == 0:
                 problems.append("World: No hay reglas del mundo definidas")
         
         is_consistent = len(problems) == 0
@@ -123,12 +173,14 @@ class ConsistencyValidator:
     # ========================================================================
     
     @staticmethod
-    def validate_narrative_progress(chapter_summaries: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+    def validate_narrative_progress(chapter_summaries: List[Dict[str, Any]],
+                                    fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida que la narrativa progrese lógicamente.
         
         Args:
             chapter_summaries: Lista de resúmenes de capítulos
+            fast_fail: Detenerse en el primer problema encontrado
             
         Returns:
             Tupla (válido: bool, lista de problemas: List[str])
@@ -140,19 +192,19 @@ class ConsistencyValidator:
             problems.append("No hay capítulos para validar progreso")
             return False, problems
         
-        # Verificar que los números de capítulo sean consecutivos
-        for i, summary in enumerate(chapter_summaries):
-            expected_num = i + 1
+        for i, summary in enumerate(chapter_summaries, 1):
+            # Verificar que los números de capítulo sean consecutivos
             actual_num = summary.get('number', -1)
+            if actual_num != i:
+                problems.append(f"Capítulo {i}: Número incorrecto (esperado {i}, encontrado {actual_num})")
             
-            if actual_num != expected_num:
-                problems.append(f"Capítulo {i+1}: Número incorrecto (esperado {expected_num}, encontrado {actual_num})")
-        
-        # Detectar capítulos sin progreso significativo
-        for i, summary in enumerate(chapter_summaries):
+            # Detectar capítulos sin progreso significativo
             summary_text = summary.get('summary', '')
             if len(summary_text) < 20:
-                problems.append(f"Capítulo {i+1}: Resumen vacío o insuficiente")
+                problems.append(f"Capítulo {i}: Resumen vacío o insuficiente")
+            
+            if fast_fail and problems:
+                return False, problems
         
         is_valid = len(problems) == 0
         
@@ -182,20 +234,12 @@ class ConsistencyValidator:
         for i, chapter in enumerate(chapters, 1):
             summary = chapter.get('summary', '').lower()
             
-            # Buscar referencias temporales
-            time_patterns = [
-                r'(\d+)\s+(días?|semanas?|meses?|años?)',
-                r'(ayer|hoy|mañana|anoche)',
-                r'(pasado|presente|futuro)'
-            ]
-            
-            for pattern in time_patterns:
-                matches = re.findall(pattern, summary)
-                if matches:
-                    temporal_refs.append({
-                        'chapter': i,
-                        'reference': matches[0] if isinstance(matches[0], str) else ' '.join(matches[0])
-                    })
+            # Buscar referencias temporales en una sola pasada
+            for match in _TIME_RE.finditer(summary):
+                temporal_refs.append({
+                    'chapter': i,
+                    'reference': match.group()
+                })
         
         # Por ahora, solo registramos las referencias encontradas
         # En una implementación más avanzada, se podría validar la coherencia temporal
@@ -230,22 +274,14 @@ class ConsistencyValidator:
         
         warnings = []
         
-        # Buscar nombres propios (palabras que empiezan con mayúscula)
-        potential_names = re.findall(r'\b[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+\b', content)
-        
-        # Filtrar nombres comunes que no son personajes
-        common_words = {'El', 'La', 'Los', 'Las', 'Un', 'Una', 'Algunos', 'Muchos'}
-        potential_names = [name for name in potential_names if name not in common_words]
-        
-        # Contar frecuencia
-        from collections import Counter
-        name_freq = Counter(potential_names)
+        # Contar nombres propios (palabras que empiezan con mayúscula)
+        name_freq = Counter(_PROPER_NAME_RE.findall(content))
         
-        # Detectar nombres frecuentes no definidos
+        # Detectar nombres frecuentes no definidos, filtrando una sola vez por
+        # nombre distinto las palabras comunes que no son personajes
         for name, count in name_freq.items():
-            if count >= 3:  # Mencionado al menos 3 veces
-                if name not in expected_characters:
-                    warnings.append(f"Capítulo {chapter_number}: '{name}' mencionado {count} veces pero no está en la lista de personajes")
+            if count >= 3 and name not in _COMMON_WORDS and name not in expected_characters:
+                warnings.append(f"Capítulo {chapter_number}: '{name}' mencionado {count} veces pero no está en la lista de personajes")
         
         is_valid = len(warnings) == 0
         
@@ -267,8 +303,7 @@ class ConsistencyValidator:
             Reporte formateado
         """
         
-        report = "📊 REPORTE DE CONSISTENCIA\n"
-        report += "=" * 60 + "\n\n"
+        parts = [_REPORT_HEADER]
         
         # Validar worldbuilding
         world = memory.get('world', {})
@@ -276,18 +311,18 @@ class ConsistencyValidator:
             world, memory.get('consistency_rules', [])
         )
         
-        report += "🌍 WORLDBUILDING:\n"
+        parts.append(_WORLD_HEADER)
         if world_valid:
-            report += "   ✅ Consistente\n"
+            parts.append("   ✅ Consistente\n")
         else:
-            report += "   ⚠️ Problemas encontrados:\n"
+            parts.append("   ⚠️ Problemas encontrados:\n")
             for problem in world_problems:
-                report += f"      - {problem}\n"
-        report += "\n"
+                parts.append(f"      - {problem}\n")
+        parts.append("\n")
         
         # Validar personajes
         characters = memory.get('characters', {})
-        report += f"👥 PERSONAJES ({len(characters)}):\n"
+        parts.append(_CHARACTERS_HEADER.format(count=len(characters)))
         
         for char_name, char_data in characters.items():
             state_history = char_data.get('state_history', [char_data.get('current_state', '')])
@@ -296,13 +331,13 @@ class ConsistencyValidator:
             )
             
             if char_valid:
-                report += f"   ✅ {char_name}: Consistente\n"
+                parts.append(f"   ✅ {char_name}: Consistente\n")
             else:
-                report += f"   ⚠️ {char_name}:\n"
+                parts.append(f"   ⚠️ {char_name}:\n")
                 for problem in char_problems:
-                    report += f"      - {problem}\n"
+                    parts.append(f"      - {problem}\n")
         
-        report += "\n"
+        parts.append("\n")
         
         # Validar progreso narrativo
         chapters_summary = memory.get('chapters_summary', [])
@@ -311,12 +346,12 @@ class ConsistencyValidator:
                 chapters_summary
             )
             
-            report += "📖 PROGRESO NARRATIVO:\n"
+            parts.append(_NARRATIVE_HEADER)
             if narrative_valid:
-                report += "   ✅ Progresión lógica\n"
+                parts.append("   ✅ Progresión lógica\n")
             else:
-                report += "   ⚠️ Problemas:\n"
+                parts.append("   ⚠️ Problemas:\n")
                 for problem in narrative_problems:
-                    report += f"      - {problem}\n"
+                    parts.append(f"      - {problem}\n")
         
-        return report
+        return "".join(parts)
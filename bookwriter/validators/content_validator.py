@@ -4,9 +4,68 @@ Verifica la calidad y coherencia del contenido producido por la IA.
 """
 
 import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple, Optional
 
 
+# Patrones precompilados
+_CHAPTER_MARKER_RE = re.compile(r'^##\s+Cap[íi]tulo', re.MULTILINE)
+_MENTE_RE = re.compile(r'\b\w+mente\b')  # se aplica sobre texto en minúsculas
+
+# Frases buscadas en el contenido (en minúsculas)
+_META_INDICATORS = (
+    'instrucciones:',
+    'nota del autor:',
+    'este capítulo debe',
+    'el personaje debería',
+    'la escena debe',
+    'importante:',
+    'recordatorio:',
+    'continúa desde aquí'
+)
+_CLICHES = (
+    'de repente', 'al final del día', 'sin previo aviso',
+    'como de costumbre', 'sin decir palabra'
+)
+_SPOILER_WORDS = ('al final', 'finalmente', 'descubre que', 'resulta ser')
+
+# Vocabulario para el análisis narrativo (se compara por palabra completa)
+_WORD_RE = re.compile(r'\w+')
+_ACTION_VERBS = frozenset({
+    'corrió', 'saltó', 'golpeó', 'gritó', 'lanzó', 'disparó',
+    'esquivó', 'atacó', 'huyó', 'persiguió', 'alcanzó'
+})
+_DESCRIPTIVE_WORDS = frozenset({
+    'oscuro', 'brillante', 'enorme', 'pequeño', 'hermoso', 'terrible',
+    'frío', 'caliente', 'suave', 'áspero'
+})
+_STOPWORDS = frozenset({
+    'el', 'la', 'los', 'las', 'de', 'del', 'a', 'en', 'y', 'que',
+    'se', 'con', 'por', 'para', 'un', 'una'
+})
+
+# Umbrales de longitud media de oración y su nivel de legibilidad
+_READ_BOUNDS = (10, 20, 30)
+_READ_LABELS = ('muy_simple', 'clara', 'moderada', 'compleja')
+
+
+@dataclass(frozen=True, slots=True)
+class _CharReq:
+    """Campo obligatorio de un personaje y su longitud mínima."""
+    name: str
+    min_len: int = 10
+
+
+_CHAR_FIELDS = (_CharReq('description'), _CharReq('personality'), _CharReq('story_arc'))
+
+# Campos obligatorios de cada sección del outline
+_OUTLINE_SECTIONS = ('world', 'characters', 'plot', 'style', 'consistency_rules')
+_CHAPTER_REQUIRED = ('number', 'title', 'summary', 'key_events', 'pages_estimate')
+_STYLE_REQUIRED = ('tone', 'point_of_view', 'tense')
+
+
 class ContentValidator:
     """
     Valida el contenido generado por la IA.
@@ -18,12 +77,14 @@ class ContentValidator:
     # ========================================================================
     
     @staticmethod
-    def validate_outline_structure(outline_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def validate_outline_structure(outline_data: Dict[str, Any],
+                                   fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida la estructura completa del outline.
         
         Args:
             outline_data: Datos del outline a validar
+            fast_fail: Detenerse en la primera sección con problemas
             
         Returns:
             Tupla (válido: bool, lista de problemas: List[str])
@@ -32,8 +93,7 @@ class ContentValidator:
         problems = []
         
         # Verificar secciones principales
-        required_sections = ['world', 'characters', 'plot', 'style', 'consistency_rules']
-        for section in required_sections:
+        for section in _OUTLINE_SECTIONS:
             if section not in outline_data:
                 problems.append(f"Falta sección requerida: '{section}'")
         
@@ -44,14 +104,23 @@ class ContentValidator:
         world_problems = ContentValidator._validate_world_section(outline_data.get('world', {}))
         problems.extend(world_problems)
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Validar characters
         char_problems = ContentValidator._validate_characters_section(outline_data.get('characters', {}))
         problems.extend(char_problems)
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Validar plot
-        plot_problems = ContentValidator._validate_plot_section(outline_data.get('plot', {}))
+        plot_problems = ContentValidator._validate_plot_section(outline_data.get('plot', {}), fast_fail)
         problems.extend(plot_problems)
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Validar style
         style_problems = ContentValidator._validate_style_section(outline_data.get('style', {}))
         problems.extend(style_problems)
@@ -84,23 +153,22 @@ class ContentValidator:
             problems.append("Characters: No hay personajes definidos")
             return problems
         
-        required_fields = ['description', 'personality', 'story_arc']
-        
         for char_name, char_data in characters.items():
-            if not isinstance(char_data, dict):
+            if type(char_data) is not dict:
                 problems.append(f"Character '{char_name}': Datos inválidos")
                 continue
             
-            for field in required_fields:
-                if field not in char_data or not char_data[field]:
-                    problems.append(f"Character '{char_name}': Falta campo '{field}'")
-                elif len(char_data[field]) < 10:
-                    problems.append(f"Character '{char_name}': Campo '{field}' demasiado breve")
+            for req in _CHAR_FIELDS:
+                value = char_data.get(req.name)
+                if not value:
+                    problems.append(f"Character '{char_name}': Falta campo '{req.name}'")
+                elif len(value) < req.min_len:
+                    problems.append(f"Character '{char_name}': Campo '{req.name}' demasiado breve")
         
         return problems
     
     @staticmethod
-    def _validate_plot_section(plot: Dict[str, Any]) -> List[str]:
+    def _validate_plot_section(plot: Dict[str, Any], fast_fail: bool = False) -> List[str]:
         """Valida la sección de trama."""
         problems = []
         
@@ -110,7 +178,7 @@ class ContentValidator:
         
         outline = plot['outline']
         
-        if not isinstance(outline, list) or len(outline) == 0:
+        if type(outline) is not list or len(outline) == 0:
             problems.append("Plot: Outline vacío o inválido")
             return problems
         
@@ -118,6 +186,8 @@ class ContentValidator:
         for i, chapter in enumerate(outline, 1):
             chapter_problems = ContentValidator._validate_chapter(chapter, i)
             problems.extend(chapter_problems)
+            if fast_fail and problems:
+                break
         
         return problems
     
@@ -127,9 +197,7 @@ class ContentValidator:
         problems = []
         prefix = f"Capítulo {expected_number}"
         
-        required_fields = ['number', 'title', 'summary', 'key_events', 'pages_estimate']
-        
-        for field in required_fields:
+        for field in _CHAPTER_REQUIRED:
             if field not in chapter:
                 problems.append(f"{prefix}: Falta campo '{field}'")
         
@@ -149,13 +217,13 @@ class ContentValidator:
         
         # Validar key_events
         if 'key_events' in chapter:
-            if not isinstance(chapter['key_events'], list) or len(chapter['key_events']) == 0:
+            if type(chapter['key_events']) is not list or len(chapter['key_events']) == 0:
                 problems.append(f"{prefix}: Debe tener al menos un evento clave")
         
         # Validar pages_estimate
         if 'pages_estimate' in chapter:
             pages = chapter['pages_estimate']
-            if not isinstance(pages, int) or pages < 5 or pages > 30:
+            if type(pages) is not int or pages < 5 or pages > 30:
                 problems.append(f"{prefix}: Estimación de páginas inválida ({pages})")
         
         return problems
@@ -165,9 +233,7 @@ class ContentValidator:
         """Valida la sección de estilo."""
         problems = []
         
-        required_fields = ['tone', 'point_of_view', 'tense']
-        
-        for field in required_fields:
+        for field in _STYLE_REQUIRED:
             if field not in style or not style[field]:
                 problems.append(f"Style: Falta campo '{field}'")
         
@@ -180,7 +246,8 @@ class ContentValidator:
     @staticmethod
     def validate_page_content(content: str,
                              min_words: int = 300,
-                             max_words: int = 700) -> Tuple[bool, List[str]]:
+                             max_words: int = 700,
+                             fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida el contenido de una página generada.
         
@@ -188,6 +255,7 @@ class ContentValidator:
             content: Contenido a validar
             min_words: Mínimo de palabras esperadas
             max_words: Máximo de palabras esperadas
+            fast_fail: Detenerse en el primer problema encontrado
             
         Returns:
             Tupla (válido: bool, lista de problemas: List[str])
@@ -209,19 +277,32 @@ class ContentValidator:
         if word_count > max_words:
             problems.append(f"Contenido demasiado largo: {word_count} palabras (máximo {max_words})")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar que no tenga marcadores de capítulo
-        if re.search(r'^##\s+Cap[íi]tulo', content, re.MULTILINE):
+        if _CHAPTER_MARKER_RE.search(content):
             problems.append("El contenido incluye marcador de capítulo (debe omitirse)")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar que no tenga bloques de código
         if '```' in content:
             problems.append("El contenido incluye bloques de código markdown")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar repetición excesiva
-        repetition_check = ContentValidator._check_repetition(content)
+        sentences = [s for s in map(str.strip, content.split('.')) if s]
+        repetition_check = ContentValidator._check_repetition(sentences)
         if repetition_check:
             problems.append(repetition_check)
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar si parece contenido meta (instrucciones, etc)
         meta_check = ContentValidator._check_meta_content(content)
         if meta_check:
@@ -232,21 +313,15 @@ class ContentValidator:
         return is_valid, problems
     
     @staticmethod
-    def _check_repetition(content: str) -> Optional[str]:
+    def _check_repetition(sentences: List[str]) -> Optional[str]:
         """Detecta repetición excesiva de frases."""
         
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
-        
         if len(sentences) < 3:
             return None
         
-        # Buscar oraciones repetidas
-        for i, sent in enumerate(sentences):
-            if len(sent) < 20:  # Oraciones muy cortas no cuentan
-                continue
-            
-            # Contar cuántas veces aparece esta oración
-            count = sum(1 for s in sentences if s == sent)
+        # Contar oraciones repetidas (las muy cortas no cuentan)
+        sentence_counts = Counter(s for s in sentences if len(s) >= 20)
+        for sent, count in sentence_counts.items():
             if count > 2:
                 return f"Oración repetida {count} veces: '{sent[:50]}...'"
         
@@ -256,20 +331,9 @@ class ContentValidator:
     def _check_meta_content(content: str) -> Optional[str]:
         """Detecta si el contenido parece meta-instrucciones."""
         
-        meta_indicators = [
-            'instrucciones:',
-            'nota del autor:',
-            'este capítulo debe',
-            'el personaje debería',
-            'la escena debe',
-            'importante:',
-            'recordatorio:',
-            'continúa desde aquí'
-        ]
-        
         content_lower = content.lower()
         
-        for indicator in meta_indicators:
+        for indicator in _META_INDICATORS:
             if indicator in content_lower:
                 return f"Contenido parece incluir meta-instrucciones ('{indicator}')"
         
@@ -304,34 +368,21 @@ class ContentValidator:
         }
         
         # Calcular longitud promedio de oración
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
-        if sentences:
-            avg_words = sum(len(s.split()) for s in sentences) / len(sentences)
+        if analysis["sentence_count"]:
+            avg_words = analysis["word_count"] / analysis["sentence_count"]
             analysis["avg_sentence_length"] = round(avg_words, 1)
         
+        # Palabras del contenido, tokenizado una sola vez
+        tokens = frozenset(_WORD_RE.findall(content.lower()))
+        
         # Detectar verbos de acción
-        action_verbs = [
-            'corrió', 'saltó', 'golpeó', 'gritó', 'lanzó', 'disparó',
-            'esquivó', 'atacó', 'huyó', 'persiguió', 'alcanzó'
-        ]
-        analysis["has_action_verbs"] = any(verb in content.lower() for verb in action_verbs)
+        analysis["has_action_verbs"] = not _ACTION_VERBS.isdisjoint(tokens)
         
         # Detectar descripciones
-        descriptive_words = [
-            'oscuro', 'brillante', 'enorme', 'pequeño', 'hermoso', 'terrible',
-            'frío', 'caliente', 'suave', 'áspero'
-        ]
-        analysis["has_descriptions"] = any(word in content.lower() for word in descriptive_words)
+        analysis["has_descriptions"] = not _DESCRIPTIVE_WORDS.isdisjoint(tokens)
         
         # Evaluar legibilidad básica
-        if analysis["avg_sentence_length"] < 10:
-            analysis["readability"] = "muy_simple"
-        elif analysis["avg_sentence_length"] < 20:
-            analysis["readability"] = "clara"
-        elif analysis["avg_sentence_length"] < 30:
-            analysis["readability"] = "moderada"
-        else:
-            analysis["readability"] = "compleja"
+        analysis["readability"] = _READ_LABELS[bisect_right(_READ_BOUNDS, analysis["avg_sentence_length"])]
         
         return analysis
     
@@ -349,29 +400,25 @@ class ContentValidator:
         
         issues = []
         
+        # Una sola copia en minúsculas para todas las verificaciones
+        content_lower = content.lower()
+        
         # Verificar uso excesivo de adverbios en -mente
-        mente_count = len(re.findall(r'\b\w+mente\b', content, re.IGNORECASE))
+        mente_count = len(_MENTE_RE.findall(content_lower))
         if mente_count > 5:
             issues.append(f"Uso excesivo de adverbios terminados en -mente ({mente_count})")
         
         # Verificar repetición de palabras
-        words = content.lower().split()
+        words = content_lower.split()
         if len(words) > 50:
-            from collections import Counter
             word_freq = Counter(words)
             # Palabras comunes a ignorar
-            common_words = {'el', 'la', 'los', 'las', 'de', 'del', 'a', 'en', 'y', 'que', 'se', 'con', 'por', 'para', 'un', 'una'}
             for word, count in word_freq.most_common(10):
-                if word not in common_words and len(word) > 4 and count > 5:
+                if word not in _STOPWORDS and len(word) > 4 and count > 5:
                     issues.append(f"Palabra '{word}' repetida {count} veces")
         
         # Verificar uso de clichés
-        cliches = [
-            'de repente', 'al final del día', 'sin previo aviso',
-            'como de costumbre', 'sin decir palabra'
-        ]
-        content_lower = content.lower()
-        for cliche in cliches:
+        for cliche in _CLICHES:
             if cliche in content_lower:
                 issues.append(f"Cliché detectado: '{cliche}'")
         
@@ -382,12 +429,13 @@ class ContentValidator:
     # ========================================================================
     
     @staticmethod
-    def validate_blurb(blurb: str) -> Tuple[bool, List[str]]:
+    def validate_blurb(blurb: str, fast_fail: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida un blurb de contraportada.
         
         Args:
             blurb: Texto del blurb
+            fast_fail: Detenerse en el primer problema encontrado
             
         Returns:
             Tupla (válido: bool, lista de problemas: List[str])
@@ -407,11 +455,16 @@ class ContentValidator:
         if word_count > 250:
             problems.append(f"Blurb demasiado largo: {word_count} palabras (máximo 250)")
         
+        if fast_fail and problems:
+            return False, problems
+        
         # Verificar que no tenga spoilers obvios
-        spoiler_words = ['al final', 'finalmente', 'descubre que', 'resulta ser']
-        for word in spoiler_words:
-            if word in blurb.lower():
+        blurb_lower = blurb.lower()
+        for word in _SPOILER_WORDS:
+            if word in blurb_lower:
                 problems.append(f"Posible spoiler detectado: '{word}'")
+                if fast_fail:
+                    break
         
         is_valid = len(problems) == 0
         
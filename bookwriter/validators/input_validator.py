@@ -3,11 +3,44 @@ Validador de entradas del usuario.
 Asegura que los datos proporcionados sean válidos antes de procesarlos.
 """
 
+import errno
+import os
 import re
-from typing import Dict, Any, List, Tuple
+import stat
+from typing import Dict, Any, List, Tuple, Optional, Mapping, Collection, Union
 from pathlib import Path
 
 
+# Patrones precompilados para sanitizar nombres de proyecto
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WS_UNDERSCORE_RE = re.compile(r'[\s_]+')
+
+# Caracteres no permitidos en nombres de proyecto (en orden de reporte)
+_INVALID_CHARS = ('<', '>', ':', '"', '/', '\\', '|', '?', '*')
+_INVALID_CHARS_SET = frozenset(_INVALID_CHARS)
+
+# Respuestas de éxito que solo dependen de un conteo acotado por la validación
+_OK_CHAPTERS = tuple((True, f"✅ {n} capítulos es válido") for n in range(51))
+_OK_THEMES = tuple((True, f"✅ {n} tema(s) válido(s)") for n in range(11))
+_OK_AUTHORS = tuple((True, f"✅ {n} autor(es) seleccionado(s)") for n in range(6))
+
+# Errores que Path.exists() interpreta como "no existe"
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+def _stat_or_none(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Hace un único stat de la ruta; None si no existe (igual que Path.exists)."""
+    try:
+        return os.stat(path)
+    except OSError as e:
+        if e.errno in _MISSING_ERRNOS:
+            return None
+        raise
+    except ValueError:
+        # Ruta no representable en el sistema (p. ej. con bytes nulos)
+        return None
+
+
 class InputValidator:
     """
     Valida todas las entradas del usuario antes de procesamiento.
@@ -30,24 +63,24 @@ class InputValidator:
             Tupla (válido: bool, mensaje: str)
         """
         
-        if not name or not name.strip():
-            return False, "❌ El nombre del proyecto no puede estar vacío"
+        name = name.strip() if name else ""
+        length = len(name)
         
-        name = name.strip()
+        if length == 0:
+            return False, "❌ El nombre del proyecto no puede estar vacío"
         
         # Longitud
-        if len(name) < 3:
+        if length < 3:
             return False, "❌ El nombre debe tener al menos 3 caracteres"
         
-        if len(name) > 100:
+        if length > 100:
             return False, "❌ El nombre es demasiado largo (máximo 100 caracteres)"
         
         # Caracteres permitidos (más flexible para soportar acentos)
         # Solo rechazamos caracteres claramente problemáticos
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        for char in invalid_chars:
-            if char in name:
-                return False, f"❌ El nombre contiene caracteres no permitidos: {char}"
+        if not _INVALID_CHARS_SET.isdisjoint(name):
+            char = next(c for c in _INVALID_CHARS if c in name)
+            return False, f"❌ El nombre contiene caracteres no permitidos: {char}"
         
         return True, "✅ Nombre válido"
     
@@ -71,18 +104,20 @@ class InputValidator:
             Tupla (válido: bool, mensaje: str)
         """
         
-        # Validar nombre
-        valid, msg = InputValidator.validate_project_name(name)
+        # Las verificaciones más baratas van primero
+        
+        # Validar número de capítulos
+        valid, msg = InputValidator.validate_chapter_count(chapters)
         if not valid:
             return False, msg
         
-        # Validar premisa
-        valid, msg = InputValidator.validate_premise(premise)
+        # Validar autores
+        valid, msg = InputValidator.validate_author_selection(authors)
         if not valid:
             return False, msg
         
-        # Validar número de capítulos
-        valid, msg = InputValidator.validate_chapter_count(chapters)
+        # Validar nombre
+        valid, msg = InputValidator.validate_project_name(name)
         if not valid:
             return False, msg
         
@@ -91,8 +126,8 @@ class InputValidator:
         if not valid:
             return False, msg
         
-        # Validar autores
-        valid, msg = InputValidator.validate_author_selection(authors)
+        # Validar premisa
+        valid, msg = InputValidator.validate_premise(premise)
         if not valid:
             return False, msg
         
@@ -114,21 +149,22 @@ class InputValidator:
             Tupla (válido: bool, mensaje: str)
         """
         
-        if not premise or not premise.strip():
-            return False, "❌ La premisa no puede estar vacía"
+        premise = premise.strip() if premise else ""
+        length = len(premise)
         
-        premise = premise.strip()
+        if length == 0:
+            return False, "❌ La premisa no puede estar vacía"
         
         # Longitud mínima
-        if len(premise) < 20:
+        if length < 20:
             return False, "❌ La premisa es demasiado corta (mínimo 20 caracteres). Proporciona más detalles sobre la historia."
         
         # Longitud máxima
-        if len(premise) > 2000:
+        if length > 2000:
             return False, "❌ La premisa es demasiado larga (máximo 2000 caracteres). Intenta ser más conciso."
         
-        # Verificar que tenga al menos algunas palabras
-        word_count = len(premise.split())
+        # Verificar que tenga al menos algunas palabras (basta con las 10 primeras)
+        word_count = len(premise.split(None, 10))
         if word_count < 10:
             return False, "❌ La premisa debe tener al menos 10 palabras. Describe mejor tu idea."
         
@@ -158,7 +194,7 @@ class InputValidator:
         if chapters > 50:
             return False, "❌ El número máximo de capítulos es 50. Para libros más largos, considera dividir en volúmenes."
         
-        return True, f"✅ {chapters} capítulos es válido"
+        return _OK_CHAPTERS[chapters]
     
     @staticmethod
     def validate_themes(themes: str) -> Tuple[bool, str]:
@@ -172,28 +208,39 @@ class InputValidator:
             Tupla (válido: bool, mensaje: str)
         """
         
-        if not themes or not themes.strip():
-            return False, "❌ Debes especificar al menos un tema para la historia"
-        
-        themes = themes.strip()
+        themes = themes.strip() if themes else ""
         
-        # Separar y limpiar temas
-        theme_list = [t.strip() for t in themes.split(',') if t.strip()]
+        if not themes:
+            return False, "❌ Debes especificar al menos un tema para la historia"
         
-        if len(theme_list) == 0:
+        # Separar, limpiar y validar temas en una sola pasada. El exceso de
+        # temas tiene prioridad sobre los errores de longitud.
+        count = 0
+        length_error = None
+        for theme in themes.split(','):
+            theme = theme.strip()
+            if not theme:
+                continue
+            
+            count += 1
+            if count > 10:
+                return False, "❌ Demasiados temas (máximo 10). Enfócate en los más importantes."
+            
+            # Validar longitud de cada tema
+            if length_error is None:
+                length = len(theme)
+                if length < 3:
+                    length_error = f"❌ El tema '{theme}' es demasiado corto (mínimo 3 caracteres)"
+                elif length > 50:
+                    length_error = f"❌ El tema '{theme}' es demasiado largo (máximo 50 caracteres)"
+        
+        if count == 0:
             return False, "❌ Debes especificar al menos un tema válido"
         
-        if len(theme_list) > 10:
-            return False, "❌ Demasiados temas (máximo 10). Enfócate en los más importantes."
-        
-        # Validar longitud de cada tema
-        for theme in theme_list:
-            if len(theme) < 3:
-                return False, f"❌ El tema '{theme}' es demasiado corto (mínimo 3 caracteres)"
-            if len(theme) > 50:
-                return False, f"❌ El tema '{theme}' es demasiado largo (máximo 50 caracteres)"
+        if length_error:
+            return False, length_error
         
-        return True, f"✅ {len(theme_list)} tema(s) válido(s)"
+        return _OK_THEMES[count]
     
     @staticmethod
     def validate_author_selection(authors: List[str]) -> Tuple[bool, str]:
@@ -219,35 +266,44 @@ class InputValidator:
         if len(authors) == 0:
             return False, "❌ Selección de autores inválida"
         
-        return True, f"✅ {len(authors)} autor(es) seleccionado(s)"
+        return _OK_AUTHORS[len(authors)]
     
     # ========================================================================
     # VALIDACIÓN DE RUTAS Y ARCHIVOS
     # ========================================================================
     
     @staticmethod
-    def validate_project_path(project_path: Path) -> Tuple[bool, str]:
+    def validate_project_path(project_path: Union[str, Path],
+                              probe_write: bool = False) -> Tuple[bool, str]:
         """
         Valida que la ruta del proyecto sea válida y accesible.
         
         Args:
-            project_path: Ruta del proyecto
+            project_path: Ruta del proyecto (str o Path)
+            probe_write: Comprobar la escritura creando un archivo de prueba
+                         (para sistemas de archivos donde os.access no es fiable)
             
         Returns:
             Tupla (válido: bool, mensaje: str)
         """
         
         try:
-            # Verificar que el path sea válido
-            if not project_path.exists():
+            # Verificar que el path sea válido (un único stat para todo)
+            st = _stat_or_none(project_path)
+            if st is None:
                 return True, "✅ Ruta válida (proyecto nuevo)"
             
             # Si existe, verificar que sea un directorio
-            if not project_path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, "❌ La ruta existe pero no es un directorio"
             
             # Verificar permisos de escritura
-            test_file = project_path / '.write_test'
+            if not probe_write:
+                if os.access(project_path, os.W_OK):
+                    return True, "✅ Ruta válida y con permisos de escritura"
+                return False, "❌ No hay permisos de escritura en esta ruta"
+            
+            test_file = Path(project_path) / '.write_test'
             try:
                 test_file.touch()
                 test_file.unlink()
@@ -259,22 +315,24 @@ class InputValidator:
             return False, f"❌ Error al validar ruta: {str(e)}"
     
     @staticmethod
-    def validate_file_exists(file_path: Path, file_description: str) -> Tuple[bool, str]:
+    def validate_file_exists(file_path: Union[str, Path], file_description: str) -> Tuple[bool, str]:
         """
         Valida que un archivo exista.
         
         Args:
-            file_path: Ruta del archivo
+            file_path: Ruta del archivo (str o Path)
             file_description: Descripción del archivo para el mensaje
             
         Returns:
             Tupla (válido: bool, mensaje: str)
         """
         
-        if not file_path.exists():
-            return False, f"❌ {file_description} no existe: {file_path.name}"
+        st = _stat_or_none(file_path)
+        if st is None:
+            file_name = os.path.basename(os.fspath(file_path))
+            return False, f"❌ {file_description} no existe: {file_name}"
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, f"❌ {file_description} no es un archivo válido"
         
         return True, f"✅ {file_description} encontrado"
@@ -307,24 +365,26 @@ class InputValidator:
     
     @staticmethod
     def validate_custom_dimensions(dimensions: Dict[str, str],
-                                   valid_dimensions: Dict[str, List[str]]) -> Tuple[bool, str]:
+                                   valid_dimensions: Mapping[str, Collection[str]]) -> Tuple[bool, str]:
         """
         Valida dimensiones personalizadas.
         
         Args:
             dimensions: Dimensiones a validar
-            valid_dimensions: Diccionario de dimensiones válidas
+            valid_dimensions: Niveles válidos por dimensión (lista, conjunto o
+                              diccionario indexado por nivel, p. ej. WRITING_DIMENSIONS)
             
         Returns:
             Tupla (válido: bool, mensaje: str)
         """
         
         for dimension, level in dimensions.items():
-            if dimension not in valid_dimensions:
+            levels = valid_dimensions.get(dimension)
+            if levels is None:
                 return False, f"❌ Dimensión '{dimension}' no reconocida"
             
-            if level not in valid_dimensions[dimension]:
-                valid_levels = ', '.join(valid_dimensions[dimension].keys())
+            if level not in levels:
+                valid_levels = ', '.join(levels)
                 return False, f"❌ Nivel '{level}' no válido para '{dimension}'. Opciones: {valid_levels}"
         
         return True, "✅ Dimensiones personalizadas válidas"
@@ -349,10 +409,10 @@ class InputValidator:
         name = name.strip()
         
         # Reemplazar caracteres problemáticos
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
+        name = _INVALID_CHARS_RE.sub('_', name)
         
         # Reemplazar múltiples espacios/guiones bajos consecutivos
-        name = re.sub(r'[\s_]+', '_', name)
+        name = _WS_UNDERSCORE_RE.sub('_', name)
         
         # Limitar longitud
         if len(name) > 100:
@@ -372,16 +432,14 @@ class InputValidator:
             Lista de temas limpia
         """
         
-        # Separar por comas
-        theme_list = themes.split(',')
-        
-        # Limpiar cada tema
+        # Separar por comas y limpiar cada tema en la misma pasada
         cleaned = []
-        for theme in theme_list:
+        for theme in themes.split(','):
             theme = theme.strip()
             if theme:
-                # Capitalizar primera letra
-                theme = theme[0].upper() + theme[1:] if len(theme) > 1 else theme.upper()
+                # Capitalizar primera letra (si ya es mayúscula se reutiliza el texto)
+                if not theme[0].isupper():
+                    theme = theme[0].upper() + theme[1:] if len(theme) > 1 else theme.upper()
                 cleaned.append(theme)
         
         return cleaned
\ No newline at end of file